@@ -8,21 +8,56 @@ Updated to support both:
 2. New Keycloak Organizations mode (single realm, multiple organizations)
 """
 
+import atexit
+import itertools
 import os
+import queue
+import re
 import subprocess
 import uuid
 import secrets
 import string
+import threading
+import time
 import requests
 import json
-from datetime import datetime
 from pathlib import Path
 
-from flask import Flask, request, jsonify, render_template_string
-from jinja2 import Template
+from flask import Flask, request, stream_with_context
+from flask.json.provider import DefaultJSONProvider
+from jinja2 import Environment, FileSystemLoader, TemplateNotFound
+from requests.adapters import HTTPAdapter
+import orjson
 import yaml
 
+# Prefer the libyaml C loader/dumper; fall back to the pure-Python ones if PyYAML was built without it
+try:
+    from yaml import CSafeLoader as _YamlLoader, CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader, SafeDumper as _YamlDumper
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson, so request bodies and any jsonify calls skip the stdlib json module"""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=kwargs.get('default', self.default)).decode('utf-8')
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
+
+if not yaml.__with_libyaml__:
+    app.logger.warning("PyYAML was built without libyaml - config parsing will use the slower pure-Python loader")
+
+def _utc_iso(timestamp=None):
+    """Format a POSIX timestamp (default: now) as an ISO 8601 UTC time with a Z suffix"""
+    return time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime(timestamp))
+
+def ojsonify(data, status=200):
+    """jsonify replacement backed by orjson, used for every API response"""
+    return app.response_class(orjson.dumps(data), status=status, mimetype='application/json')
 
 # Configuration
 KEYCLOAK_CONFIGS_REPO_PATH = os.getenv('KEYCLOAK_CONFIGS_REPO_PATH', '/app/keycloak-configs')
@@ -37,18 +72,92 @@ PORT = int(os.getenv('PORT', 5001))
 KTA_MODE = os.getenv('KTA_MODE', 'realm')  # 'realm' or 'organizations'
 ORGANIZATIONS_REALM = os.getenv('ORGANIZATIONS_REALM', 'kta-organizations')
 
-TENANT_TEMPLATE_PATH = os.path.join(KEYCLOAK_CONFIGS_REPO_PATH, '_templates', 'tenant-template.yaml')
-SIMPLE_TEMPLATE_PATH = os.path.join(KEYCLOAK_CONFIGS_REPO_PATH, '_templates', 'simple-tenant-template.yaml')
-ORG_TEMPLATE_PATH = os.path.join(KEYCLOAK_CONFIGS_REPO_PATH, '_templates', 'organization-template.yaml.j2')
-ORG_REALM_TEMPLATE_PATH = os.path.join(KEYCLOAK_CONFIGS_REPO_PATH, '_templates', 'organizations-realm-template.yaml')
+# Refresh cached admin tokens this many seconds before Keycloak expires them
+TOKEN_EXPIRY_SKEW = 30
+# (connect, read) timeout in seconds for Keycloak admin calls, so a slow Keycloak can't hang a worker
+KEYCLOAK_TIMEOUT = (3.05, 10)
+
+# Git batching: config files queued within the idle window share one commit and push
+GIT_BATCH_WINDOW = float(os.getenv('GIT_BATCH_WINDOW', 1.0))
+GIT_BATCH_MAX = int(os.getenv('GIT_BATCH_MAX', 20))
+# Finished git operations kept for the status endpoints; older ones are evicted first
+GIT_STATUS_HISTORY = int(os.getenv('GIT_STATUS_HISTORY', 1000))
+# Seconds to wait at shutdown for queued git work to be committed and pushed; kept below
+# gunicorn's default 30 second graceful timeout
+GIT_DRAIN_TIMEOUT = float(os.getenv('GIT_DRAIN_TIMEOUT', 25))
+
+TEMPLATES_DIR = os.path.join(KEYCLOAK_CONFIGS_REPO_PATH, '_templates')
+TENANT_TEMPLATE_PATH = os.path.join(TEMPLATES_DIR, 'tenant-template.yaml')
+SIMPLE_TEMPLATE_PATH = os.path.join(TEMPLATES_DIR, 'simple-tenant-template.yaml')
+ORG_TEMPLATE_PATH = os.path.join(TEMPLATES_DIR, 'organization-template.yaml.j2')
+ORG_REALM_TEMPLATE_PATH = os.path.join(TEMPLATES_DIR, 'organizations-realm-template.yaml')
 TENANTS_DIR = os.path.join(KEYCLOAK_CONFIGS_REPO_PATH, 'tenants')
 ORGS_DIR = os.path.join(KEYCLOAK_CONFIGS_REPO_PATH, 'organizations')
+# Per-request config paths are built by concatenation with these rather than os.path.join
+_TENANTS_PREFIX = TENANTS_DIR + os.sep
+_ORGS_PREFIX = ORGS_DIR + os.sep
 APPLY_SCRIPT_PATH = os.path.join(os.path.dirname(KEYCLOAK_CONFIGS_REPO_PATH), 'scripts', 'apply-organizations.sh')
 
 # Ensure directories exist
 os.makedirs(TENANTS_DIR, exist_ok=True)
 os.makedirs(ORGS_DIR, exist_ok=True)
 
+# Templates don't change while the process runs, so skip Jinja's per-render mtime check
+_JINJA_ENV = Environment(
+    loader=FileSystemLoader(TEMPLATES_DIR),
+    auto_reload=False
+)
+
+_PLACEHOLDER_RE = re.compile(r'\{\{\s*([A-Za-z_][A-Za-z0-9_]*)\s*\}\}')
+
+class _MissingBlank(dict):
+    """format_map mapping that renders unknown names as empty strings, like Jinja's Undefined"""
+    def __missing__(self, key):
+        return ''
+
+class _PlaceholderTemplate:
+    """A Jinja template that only substitutes {{ NAME }} placeholders, rendered with str.format_map"""
+    
+    def __init__(self, source):
+        parts = _PLACEHOLDER_RE.split(source)
+        # Jinja drops a single trailing newline by default
+        if parts[-1].endswith('\n'):
+            parts[-1] = parts[-1][:-1]
+        # Even parts are literal text, odd parts are placeholder names
+        self.format_string = ''.join(
+            '{' + part + '}' if i % 2 else part.replace('{', '{{').replace('}', '}}')
+            for i, part in enumerate(parts)
+        )
+    
+    @classmethod
+    def from_source(cls, source):
+        """Build a _PlaceholderTemplate, or return None if the source uses any other Jinja syntax"""
+        literal = _PLACEHOLDER_RE.sub('', source)
+        if any(marker in literal for marker in ('{{', '{%', '{#')):
+            return None
+        return cls(source.replace('\r\n', '\n'))
+    
+    def render(self, *args, **kwargs):
+        return self.format_string.format_map(_MissingBlank(*args, **kwargs))
+
+def _compile_template(path):
+    """Compile a template file, or return None if it does not exist"""
+    name = os.path.basename(path)
+    try:
+        source, _, _ = _JINJA_ENV.loader.get_source(_JINJA_ENV, name)
+    except TemplateNotFound:
+        return None
+    
+    # Plain placeholder templates skip Jinja entirely; anything with tags or filters is compiled
+    return _PlaceholderTemplate.from_source(source) or _JINJA_ENV.get_template(name)
+
+# Templates are static for the process lifetime, so compile them once at startup
+TEMPLATES = {
+    'simple': _compile_template(SIMPLE_TEMPLATE_PATH),
+    'complex': _compile_template(TENANT_TEMPLATE_PATH),
+    'org': _compile_template(ORG_TEMPLATE_PATH)
+}
+
 class KeycloakClient:
     """Keycloak Admin API client - limited to read-only operations for organizations mode"""
     
@@ -56,39 +165,78 @@ class KeycloakClient:
         self.base_url = KEYCLOAK_URL
         self.admin_user = KEYCLOAK_ADMIN_USER
         self.admin_password = KEYCLOAK_ADMIN_PASSWORD
-        self.token = None
-        self.token_expires = None
+        # (access token, monotonic expiry) published as one tuple so lock-free readers never see a
+        # token paired with another token's expiry
+        self.access = (None, 0.0)
+        self.refresh_token = None
+        self.refresh_expires = None
+        self._token_lock = threading.Lock()
+        
+        # Shared session so admin calls reuse pooled keep-alive connections
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=20, pool_maxsize=20)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
     
     def get_admin_token(self):
-        """Get admin access token"""
-        try:
-            token_url = f"{self.base_url}/realms/master/protocol/openid-connect/token"
+        """Get admin access token, using the refresh token when one is still valid"""
+        token_url = f"{self.base_url}/realms/master/protocol/openid-connect/token"
+        if self.refresh_token and time.monotonic() < self.refresh_expires:
             data = {
-                'grant_type': 'password',
+                'grant_type': 'refresh_token',
                 'client_id': 'admin-cli',
-                'username': self.admin_user,
-                'password': self.admin_password
+                'refresh_token': self.refresh_token
             }
-            
-            app.logger.debug(f"Getting token from: {token_url}")
-            response = requests.post(token_url, data=data)
+            if self._request_token(token_url, data):
+                return self.access[0]
+            # Refresh token was rejected (e.g. SSO session ended) - fall back to password grant
+            self.refresh_token = None
+        
+        data = {
+            'grant_type': 'password',
+            'client_id': 'admin-cli',
+            'username': self.admin_user,
+            'password': self.admin_password
+        }
+        if self._request_token(token_url, data):
+            return self.access[0]
+        return None
+    
+    def _request_token(self, token_url, data):
+        """POST a token grant and store the resulting tokens with their expiry"""
+        try:
+            app.logger.debug("Getting token from: %s (%s)", token_url, data['grant_type'])
+            response = self.session.post(token_url, data=data, timeout=KEYCLOAK_TIMEOUT)
             response.raise_for_status()
             
             token_data = response.json()
-            self.token = token_data['access_token']
+            now = time.monotonic()
+            self.access = (token_data['access_token'], now + token_data.get('expires_in', 60) - TOKEN_EXPIRY_SKEW)
+            self.refresh_token = token_data.get('refresh_token')
+            self.refresh_expires = now + token_data.get('refresh_expires_in', 0) - TOKEN_EXPIRY_SKEW
             app.logger.debug("Successfully obtained admin token")
-            return self.token
+            return True
             
         except Exception as e:
-            app.logger.error(f"Failed to get admin token: {e}")
-            app.logger.error(f"Token URL: {token_url}")
-            app.logger.error(f"Response status: {response.status_code if 'response' in locals() else 'No response'}")
-            return None
+            app.logger.error("Failed to get admin token: %s", e)
+            app.logger.error("Token URL: %s", token_url)
+            app.logger.error("Response status: %s", response.status_code if 'response' in locals() else 'No response')
+            return False
+    
+    def _cached_token(self):
+        """Return the cached access token if it is not about to expire"""
+        token, expires = self.access
+        if token and time.monotonic() < expires:
+            return token
+        return None
     
     def get_headers(self):
-        """Get authorization headers"""
-        # Always get a fresh token to avoid expiration issues
-        token = self.get_admin_token()
+        """Get authorization headers, reusing the cached token until it nears expiry"""
+        token = self._cached_token()
+        if token is None:
+            with self._token_lock:
+                # Another request may have refreshed the token while we waited for the lock
+                token = self._cached_token() or self.get_admin_token()
         if not token:
             raise Exception("Failed to get admin token")
         
@@ -102,19 +250,19 @@ class KeycloakClient:
         try:
             url = f"{self.base_url}/admin/realms/{realm_name}/organizations"
             
-            response = requests.get(url, headers=self.get_headers())
+            response = self.session.get(url, headers=self.get_headers(), timeout=KEYCLOAK_TIMEOUT)
             response.raise_for_status()
             
             return {'success': True, 'organizations': response.json()}
             
         except Exception as e:
-            app.logger.error(f"Failed to list organizations: {e}")
+            app.logger.error("Failed to list organizations: %s", e)
             return {'success': False, 'error': str(e), 'organizations': []}
 
 keycloak_client = KeycloakClient()
 
 def setup_git_credentials():
-    """Setup git credentials for authenticated push operations"""
+    """Setup git credentials and commit identity for authenticated push operations"""
     if GITHUB_TOKEN and GITHUB_REPO:
         try:
             # Configure git to use token for authentication
@@ -122,11 +270,16 @@ def setup_git_credentials():
             subprocess.run([
                 "git", "-C", KEYCLOAK_CONFIGS_REPO_PATH,
                 "remote", "set-url", "origin", repo_url
-            ], capture_output=True, text=True)
+            ], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            
+            # Commit identity is static for the process lifetime, so set it here rather than per commit
+            subprocess.run(["git", "config", "--global", "user.email", "kta-backend@example.com"], check=True)
+            subprocess.run(["git", "config", "--global", "user.name", "KTA Backend"], check=True)
+            
             app.logger.info("Git credentials configured successfully")
             return True
         except Exception as e:
-            app.logger.warning(f"Failed to setup git credentials: {e}")
+            app.logger.warning("Failed to setup git credentials: %s", e)
             return False
     else:
         app.logger.warning("GITHUB_TOKEN or GITHUB_REPO not set - Git push may fail")
@@ -134,259 +287,420 @@ def setup_git_credentials():
 
 setup_git_credentials()
 
+# Covers the realm password policy's specialChars(1); none of these need escaping inside the
+# templates' double-quoted YAML scalars
+_PASSWORD_SPECIALS = "!@#$"
+_PASSWORD_ALPHABET = string.ascii_letters + string.digits + _PASSWORD_SPECIALS
+# Bytes at or above this are discarded so every alphabet character is equally likely
+_PASSWORD_BYTE_LIMIT = 256 - 256 % len(_PASSWORD_ALPHABET)
+# The realm password policy requires one lower case, upper case, digit and special character
+_PASSWORD_CLASSES = tuple(
+    frozenset(chars)
+    for chars in (string.ascii_lowercase, string.ascii_uppercase, string.digits, _PASSWORD_SPECIALS)
+)
+
 def generate_secure_password(length=16):
-    """Generate a secure random password"""
-    alphabet = string.ascii_letters + string.digits + "l!@#$"
-    password = ''.join(secrets.choice(alphabet) for _ in range(length))
-    return password
+    """Generate a secure random password from a single batch of OS entropy"""
+    alphabet_size = len(_PASSWORD_ALPHABET)
+    while True:
+        password = []
+        while len(password) < length:
+            password.extend(
+                _PASSWORD_ALPHABET[b % alphabet_size]
+                for b in secrets.token_bytes(length * 2) if b < _PASSWORD_BYTE_LIMIT
+            )
+        password = ''.join(password[:length])
+        
+        # Redraw the roughly 1 in 5 passwords that miss a class the password policy requires
+        if length < len(_PASSWORD_CLASSES) or all(not chars.isdisjoint(password) for chars in _PASSWORD_CLASSES):
+            return password
+
+# At least one letter or digit: ids made only of "_" and "-" are rejected
+_TENANT_ID_CHARS_RE = re.compile(r'(?=[_-]*[A-Za-z0-9])[A-Za-z0-9_-]+')
+# Every rule below in one pass; the individual checks only run to pick the error message
+_TENANT_ID_RE = re.compile(r'(?!-)(?=[_-]*[A-Za-z0-9])[A-Za-z0-9_-]{3,50}(?<!-)')
 
 def validate_tenant_id(tenant_id):
     """Validate tenant ID format"""
     if not tenant_id:
         return False, "Tenant ID is required"
     
+    if _TENANT_ID_RE.fullmatch(tenant_id):
+        return True, None
+    
     if len(tenant_id) < 3 or len(tenant_id) > 50:
         return False, "Tenant ID must be between 3 and 50 characters"
     
-    if not tenant_id.replace('_', '').replace('-', '').isalnum():
+    if not _TENANT_ID_CHARS_RE.fullmatch(tenant_id):
         return False, "Tenant ID can only contain letters, numbers, hyphens, and underscores"
     
-    if tenant_id.startswith('-') or tenant_id.endswith('-'):
-        return False, "Tenant ID cannot start or end with a hyphen"
-    
-    return True, None
+    # Length and characters are fine, so the full match failed on a leading or trailing hyphen
+    return False, "Tenant ID cannot start or end with a hyphen"
+
+def _write_file_atomic(path, data, exclusive=False):
+    """
+    Write bytes to a temp file, sync it and rename it over path so readers never see a partial file.
+    With exclusive=True the file is published with a hard link instead, raising FileExistsError
+    if path already exists rather than replacing it.
+    Returns the written file's stat result, which the rename leaves unchanged.
+    """
+    tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+        getattr(os, 'fdatasync', os.fsync)(fd)
+        st = os.fstat(fd)
+    except BaseException:
+        os.close(fd)
+        os.unlink(tmp_path)
+        raise
+    os.close(fd)
+    if not exclusive:
+        os.replace(tmp_path, path)
+        return st
+    try:
+        os.link(tmp_path, path)
+    finally:
+        os.unlink(tmp_path)
+    return st
+
+# tenant_id -> (st_mtime_ns, st_size, encoded /api/tenants/<id> body) so unchanged configs aren't re-parsed
+_TENANT_INFO_CACHE = {}
+
+# A top-level "displayName: value" line; generated configs have it within the first few lines
+_DISPLAY_NAME_RE = re.compile(rb'^displayName:[ \t]*([^\r\n]*)', re.M)
+
+def _extract_display_name(path):
+    """Read the top-level displayName from a tenant config, stopping the event stream once found"""
+    with open(path, 'rb') as f:
+        # Fast path: find the key in the file head and parse only its one-line value
+        head = f.read(4096)
+        match = _DISPLAY_NAME_RE.search(head)
+        if match and match.end() < len(head) and not match.group(1).startswith((b'|', b'>')):
+            try:
+                value = yaml.load(match.group(1), Loader=_YamlLoader)
+            except yaml.YAMLError:
+                value = None
+            if isinstance(value, str):
+                return value
+        
+        f.seek(0)
+        depth = 0
+        expect_key = True
+        is_display_name = False
+        for event in yaml.parse(f, Loader=_YamlLoader):
+            if isinstance(event, yaml.CollectionStartEvent):
+                depth += 1
+                is_display_name = False
+            elif isinstance(event, yaml.CollectionEndEvent):
+                depth -= 1
+                expect_key = True
+            elif depth == 1 and isinstance(event, (yaml.ScalarEvent, yaml.AliasEvent)):
+                if expect_key:
+                    is_display_name = getattr(event, 'value', None) == 'displayName'
+                elif is_display_name:
+                    return event.value
+                expect_key = not expect_key
+    return None
+
+# In-memory index of config files so listing and existence checks don't scan the filesystem
+_index_lock = threading.Lock()
+_TENANTS = {}  # tenant_id -> {"path", "mtime", "display_name" and "entry" (filled lazily)}
+_ORGS = set()
+# Bumped whenever the tenant index changes and used as the /api/tenants ETag; the per-process
+# prefix keeps ETags issued before a restart from matching the new process's versions
+_index_version = 0
+_INDEX_ETAG_PREFIX = uuid.uuid4().hex[:8]
+# (index version, encoded /api/tenants body) for the last listing served
+_tenant_list_cache = (None, b'')
+# Legacy organization configs live in the tenants directory as <tenant_id>_org.yaml; the index
+# keeps a (path, name, tenant_id) row for each of them
+_ORG_SUFFIX = '_org.yaml'
+_org_files = []
+
+def _bump_index_version():
+    """Mark the tenant index as changed; call with _index_lock held"""
+    global _index_version
+    _index_version += 1
+
+# TENANTS_DIR and ORGS_DIR mtimes (ns) the index was last built from; None forces a rescan
+_index_dir_mtimes = None
+# Directory mtimes this close to now aren't trusted, since a file added within the same timestamp
+# tick as the scan would leave them unchanged
+_RACY_MTIME_NS = 2 * 10**9
+
+def refresh_index(force=False):
+    """
+    Bring the tenant/organization index in line with the disk, keeping display names of unchanged
+    files. The directories are only rescanned when their mtimes show an entry was added or removed.
+    """
+    global _index_dir_mtimes, _org_files
+
+    with _index_lock:
+        # Stat before scanning so anything changed during the scan shows up as a newer mtime
+        dir_mtimes = (os.stat(TENANTS_DIR).st_mtime_ns, os.stat(ORGS_DIR).st_mtime_ns)
+        if not force and dir_mtimes == _index_dir_mtimes:
+            return
+
+        tenants = {}
+        org_files = []
+        with os.scandir(TENANTS_DIR) as entries:
+            for entry in entries:
+                if not entry.name.endswith('.yaml'):
+                    continue
+                try:
+                    mtime = entry.stat().st_mtime
+                except FileNotFoundError:
+                    # Deleted between the directory read and the stat
+                    continue
+                tenants[entry.name[:-5]] = {'path': entry.path, 'mtime': mtime}
+                tenant_id = entry.name.removesuffix(_ORG_SUFFIX)
+                if tenant_id != entry.name and entry.is_file(follow_symlinks=False):
+                    org_files.append((entry.path, entry.name, tenant_id))
+        with os.scandir(ORGS_DIR) as entries:
+            orgs = {entry.name[:-5] for entry in entries if entry.name.endswith('.yaml')}
+
+        # Scanned and swapped under the lock, so a concurrent signup or delete can't be undone
+        for tenant_id, meta in tenants.items():
+            previous = _TENANTS.get(tenant_id)
+            if previous and previous['mtime'] == meta['mtime']:
+                for key in ('display_name', 'entry'):
+                    if key in previous:
+                        meta[key] = previous[key]
+        if tenants.keys() != _TENANTS.keys() or any(
+            meta['mtime'] != _TENANTS[tenant_id]['mtime'] for tenant_id, meta in tenants.items()
+        ):
+            _bump_index_version()
+        _TENANTS.clear()
+        _TENANTS.update(tenants)
+        _ORGS.clear()
+        _ORGS.update(orgs)
+        _org_files = org_files
+        _index_dir_mtimes = dir_mtimes if time.time_ns() - max(dir_mtimes) > _RACY_MTIME_NS else None
+
+refresh_index()
 
 def check_tenant_exists(tenant_id):
     """Check if tenant configuration already exists"""
-    tenant_config_path = os.path.join(TENANTS_DIR, f"{tenant_id}.yaml")
-    org_config_path = os.path.join(ORGS_DIR, f"{tenant_id}.yaml")
-    return os.path.exists(tenant_config_path) or os.path.exists(org_config_path)
+    refresh_index()
+    with _index_lock:
+        return tenant_id in _TENANTS or tenant_id in _ORGS
+
+_git_queue = queue.Queue()
+# (kind, entity_id) -> {"status": queued|in_progress|pushed|committed|failed, "error": ...}, oldest first
+_git_status = {}
+_git_status_lock = threading.Lock()
+_GIT_PENDING_STATES = ("queued", "in_progress")
+_git_worker = None
+_git_worker_lock = threading.Lock()
+
+def _set_git_status(key, status, error=None):
+    """Record a git operation's state, evicting the oldest finished entries beyond GIT_STATUS_HISTORY"""
+    with _git_status_lock:
+        # Re-insert so the dict stays ordered by last update
+        _git_status.pop(key, None)
+        _git_status[key] = {"status": status, "error": error}
+        excess = len(_git_status) - GIT_STATUS_HISTORY
+        if excess > 0:
+            finished = [k for k, v in _git_status.items() if v["status"] not in _GIT_PENDING_STATES]
+            for k in finished[:excess]:
+                del _git_status[k]
 
 def git_operations(entity_id, action="add"):
     """
-    Performs git operations (add, commit, push) for a new config file.
-    Action can be 'add' for tenants or 'add_org' for organizations.
+    Queues a config file change for the background git worker, which adds,
+    commits and pushes it together with any other pending files.
+    Action can be 'add' or 'remove' for tenants, or 'add_org' for organizations.
+    Removals are committed locally even when push credentials are not configured.
+    Returns (True, None) once queued, or (False, reason) when git is skipped.
     """
-    if not GITHUB_TOKEN or not GITHUB_REPO:
+    global _git_worker
+
+    if (not GITHUB_TOKEN or not GITHUB_REPO) and action != "remove":
         app.logger.warning("GITHUB_TOKEN or GITHUB_REPO not set. Skipping git operations.")
         return False, "Git credentials not configured."
 
-    try:
-        setup_git_credentials()
+    if action == "add_org":
+        file_path = f"keycloak-configs/organizations/{entity_id}.yaml"
+        commit_message = f"feat: add organization {entity_id}"
+    elif action == "remove":
+        file_path = f"keycloak-configs/tenants/{entity_id}.yaml"
+        commit_message = f"feat: Remove tenant configuration for {entity_id}"
+    else: # Default to tenant
+        file_path = f"keycloak-configs/tenants/{entity_id}.yaml"
+        commit_message = f"feat: add tenant {entity_id}"
 
-        repo_path = Path(KEYCLOAK_CONFIGS_REPO_PATH).parent
+    # Tenants and organizations have separate id spaces
+    key = ("organization" if action == "add_org" else "tenant", entity_id)
+    _set_git_status(key, "queued")
+    _git_queue.put((key, file_path, commit_message))
+
+    # Start the worker lazily so it lives in the process that serves requests
+    with _git_worker_lock:
+        if _git_worker is None or not _git_worker.is_alive():
+            _git_worker = threading.Thread(target=_git_worker_loop, name="kta-git-worker", daemon=True)
+            _git_worker.start()
+
+    return True, None
+
+def _git_worker_loop():
+    """
+    Drain the git queue, flushing once it has been idle for GIT_BATCH_WINDOW or holds GIT_BATCH_MAX files.
+    A None item flushes the pending batch and stops the worker.
+    """
+    stopping = False
+    while not stopping:
+        item = _git_queue.get()
+        if item is None:
+            return
+        batch = [item]
+        while len(batch) < GIT_BATCH_MAX:
+            try:
+                item = _git_queue.get(timeout=GIT_BATCH_WINDOW)
+            except queue.Empty:
+                break
+            if item is None:
+                stopping = True
+                break
+            batch.append(item)
+
+        for key, _, _ in batch:
+            _set_git_status(key, "in_progress")
+        success, error = _commit_and_push(batch)
+        # The pull may have brought in or rewritten configs created elsewhere. A failed refresh
+        # must not kill the worker or leave this batch's statuses pending forever.
+        try:
+            refresh_index(force=True)
+        except Exception as e:
+            app.logger.warning("Failed to refresh the config index after a git batch: %s", e)
+        if not success:
+            status = "failed"
+        elif GITHUB_TOKEN and GITHUB_REPO:
+            status = "pushed"
+        else:
+            status = "committed"
+        for key, _, _ in batch:
+            _set_git_status(key, status, None if success else error)
+
+def _drain_git_queue():
+    """Commit and push queued work before the process exits, since the worker is a daemon thread"""
+    worker = _git_worker
+    if not worker or not worker.is_alive():
+        return
+    
+    _git_queue.put(None)
+    worker.join(GIT_DRAIN_TIMEOUT)
+    if worker.is_alive():
+        app.logger.warning("Git queue not drained within %ss; remaining configs are re-queued at next startup", GIT_DRAIN_TIMEOUT)
+
+# Runs on interpreter exit, including gunicorn's graceful worker shutdown on SIGTERM
+atexit.register(_drain_git_queue)
+
+def _requeue_uncommitted_configs():
+    """
+    Queue config files a previous process wrote but never committed, e.g. because it was killed
+    before its git batch ran. Deleted tenant configs are queued as removals.
+    """
+    repo_path = Path(KEYCLOAK_CONFIGS_REPO_PATH).parent
+    tenants_dir, orgs_dir = "keycloak-configs/tenants", "keycloak-configs/organizations"
+    result = subprocess.run(
+        ["git", "ls-files", "-z", "--others", "--modified", "--deleted", "--exclude-standard", "--", tenants_dir, orgs_dir],
+        cwd=repo_path, capture_output=True, text=True, check=True
+    )
+    
+    # Modified deletions are listed twice
+    for path in dict.fromkeys(filter(None, result.stdout.split('\0'))):
+        directory, _, name = path.rpartition('/')
+        entity_id = name.removesuffix('.yaml')
+        if entity_id == name:
+            continue
         
-        if action == "add_org":
-            file_path = f"keycloak-configs/organizations/{entity_id}.yaml"
-            commit_message = f"feat: add organization {entity_id}"
-        else: # Default to tenant
-            file_path = f"keycloak-configs/tenants/{entity_id}.yaml"
-            commit_message = f"feat: add tenant {entity_id}"
+        exists = os.path.lexists(os.path.join(repo_path, path))
+        if directory == tenants_dir:
+            git_operations(entity_id, "add" if exists else "remove")
+        elif directory == orgs_dir and exists:
+            # Organizations are never deleted by the app
+            git_operations(entity_id, "add_org")
+
+def _commit_and_push(batch):
+    """Performs git operations (add, commit, push) for a batch of queued config files"""
+    file_paths = [file_path for _, file_path, _ in batch]
+    if len(batch) == 1:
+        commit_message = batch[0][2]
+    else:
+        commit_message = f"feat: update {len(batch)} configurations\n\n" + "\n".join(message for _, _, message in batch)
+
+    try:
+        repo_path = Path(KEYCLOAK_CONFIGS_REPO_PATH).parent
 
+        # Deleted configs are staged as removals; ones that were never committed (created and
+        # deleted within the same batch) are dropped, as git rejects pathspecs it does not know
+        missing = [path for path in file_paths if not os.path.lexists(os.path.join(repo_path, path))]
+        if missing:
+            tracked = subprocess.run(
+                ["git", "ls-files", "-z", "--", *missing], cwd=repo_path, check=True, capture_output=True, text=True
+            ).stdout.split('\0')
+            file_paths = [path for path in file_paths if path not in missing or path in tracked]
+            if not file_paths:
+                app.logger.info("No changes to commit. Queued configs were never tracked.")
+                return True, "No changes to commit."
+        
         # Git commands
-        subprocess.run(["git", "config", "--global", "user.email", "kta-backend@example.com"], cwd=repo_path, check=True)
-        subprocess.run(["git", "config", "--global", "user.name", "KTA Backend"], cwd=repo_path, check=True)
-        subprocess.run(["git", "pull", "--rebase"], cwd=repo_path, check=True)
-        subprocess.run(["git", "add", file_path], cwd=repo_path, check=True)
+        subprocess.run(["git", "add", "--all", "--", *file_paths], cwd=repo_path, check=True)
         
-        # Check if there are changes to commit
-        status_result = subprocess.run(["git", "status", "--porcelain"], cwd=repo_path, check=True, capture_output=True, text=True)
-        if not status_result.stdout:
-            app.logger.info("No changes to commit. Working tree clean.")
-            return True, "No changes to commit."
-
-        subprocess.run(["git", "commit", "-m", commit_message], cwd=repo_path, check=True)
-        subprocess.run(["git", "push", f"https://{GITHUB_TOKEN}@github.com/{GITHUB_REPO}.git"], cwd=repo_path, check=True)
+        # Commit straight away; only a failed commit needs the extra check for an unchanged index.
+        # Passing the paths limits git's index refresh to these files instead of every tracked file,
+        # and keeps anything else that happens to be staged out of the commit.
+        commit_args = ["git", "commit", "-m", commit_message, "--", *file_paths]
+        commit_result = subprocess.run(commit_args, cwd=repo_path, capture_output=True, text=True)
+        if commit_result.returncode != 0:
+            # Exit code 0 means the index matches HEAD for these paths
+            if subprocess.run(["git", "diff", "--cached", "--quiet", "--", *file_paths], cwd=repo_path).returncode == 0:
+                app.logger.info("No changes to commit. Index matches HEAD.")
+                return True, "No changes to commit."
+            raise subprocess.CalledProcessError(
+                commit_result.returncode, commit_args, commit_result.stdout, commit_result.stderr
+            )
+        
+        if not GITHUB_TOKEN or not GITHUB_REPO:
+            app.logger.info("Committed %s locally; push credentials not configured", ', '.join(file_paths))
+            return True, None
+        
+        # Push optimistically and only pay for a pull when the remote has moved ahead of us
+        push_url = f"https://{GITHUB_TOKEN}@github.com/{GITHUB_REPO}.git"
+        push_result = subprocess.run(["git", "push", push_url], cwd=repo_path, capture_output=True, text=True)
+        if push_result.returncode != 0:
+            app.logger.info("Push rejected, rebasing onto remote and retrying: %s", push_result.stderr.strip())
+            subprocess.run(["git", "pull", "--rebase", "--autostash"], cwd=repo_path, check=True)
+            subprocess.run(["git", "push", push_url], cwd=repo_path, check=True)
         
-        app.logger.info(f"Successfully committed and pushed {file_path}")
+        app.logger.info("Successfully committed and pushed %s", ', '.join(file_paths))
         return True, None
     except subprocess.CalledProcessError as e:
-        app.logger.error(f"Git operation failed: {e}")
-        app.logger.error(f"Stderr: {e.stderr}")
-        app.logger.error(f"Stdout: {e.stdout}")
+        app.logger.error("Git operation failed: %s", e)
+        app.logger.error("Stderr: %s", e.stderr)
+        app.logger.error("Stdout: %s", e.stdout)
         return False, str(e)
     except Exception as e:
-        app.logger.error(f"An unexpected error occurred during git operation: {e}")
+        app.logger.error("An unexpected error occurred during git operation: %s", e)
         return False, str(e)
 
+if GITHUB_TOKEN and GITHUB_REPO:
+    try:
+        _requeue_uncommitted_configs()
+    except (OSError, subprocess.CalledProcessError) as e:
+        app.logger.warning("Could not check for uncommitted configs: %s", e)
+
 @app.route('/')
 def index():
     """Landing page with tenant creation UI"""
-    html_template = """
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <title>KTA - Keycloak Tenant Automation</title>
-        <style>
-            body { font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', roboto, oxygen, ubuntu, cantarell, sans-serif; margin: 0; padding: 20px; background: #f5f5f5; }
-            .container { max-width: 800px; margin: 0 auto; background: white; padding: 30px; border-radius: 8px; box-shadow: 0 2px 10px rgba(0,0,0,0.1); }
-            .header { text-align: center; margin-bottom: 30px; }
-            .form-group { margin-bottom: 20px; }
-            label { display: block; margin-bottom: 5px; font-weight: 600; color: #333; }
-            input[type="text"], select { width: 100%; padding: 12px; border: 1px solid #ddd; border-radius: 4px; font-size: 16px; box-sizing: border-box; }
-            input[type="text"]:focus, select:focus { outline: none; border-color: #007bff; box-shadow: 0 0 0 2px rgba(0,123,255,0.25); }
-            .btn { background: #007bff; color: white; padding: 12px 24px; border: none; border-radius: 4px; cursor: pointer; font-size: 16px; font-weight: 600; }
-            .btn:hover { background: #0056b3; }
-            .btn:disabled { background: #6c757d; cursor: not-allowed; }
-            .result { margin-top: 20px; padding: 15px; border-radius: 4px; }
-            .success { background: #d4edda; border: 1px solid #c3e6cb; color: #155724; }
-            .error { background: #f8d7da; border: 1px solid #f5c6cb; color: #721c24; }
-            .loading { background: #cce7ff; border: 1px solid #b3d9ff; color: #004085; }
-            .template-info { background: #e2e3e5; padding: 15px; border-radius: 4px; margin-bottom: 20px; }
-            .tenants-list { margin-top: 30px; }
-            .tenant-item { background: #f8f9fa; padding: 10px; margin: 5px 0; border-radius: 4px; border-left: 4px solid #007bff; }
-            small { color: #666; font-size: 14px; }
-            .spinner { display: inline-block; width: 16px; height: 16px; border: 2px solid #f3f3f3; border-top: 2px solid #007bff; border-radius: 50%; animation: spin 1s linear infinite; }
-            @keyframes spin { 0% { transform: rotate(0deg); } 100% { transform: rotate(360deg); } }
-        </style>
-    </head>
-    <body>
-        <div class="container">
-            <div class="header">
-                <h1> KTA - Keycloak Tenant Automation</h1>
-                <p>Create and deploy Keycloak tenant configurations with GitOps</p>
-            </div>
-            
-            <div class="template-info">
-                <h3> Template Options:</h3>
-                <p><strong>Simple Template:</strong> Basic realm with working user creation (recommended for demos)</p>
-                <p><strong>Complex Template:</strong> Full-featured realm with all advanced Keycloak capabilities</p>
-            </div>
-            
-            <form id="tenantForm">
-                <div class="form-group">
-                    <label for="tenant_id">Tenant ID:</label>
-                    <input type="text" id="tenant_id" name="tenant_id" placeholder="e.g., acme_corp, demo_company" required>
-                    <small>Only letters, numbers, hyphens, and underscores. 3-50 characters.</small>
-                </div>
-                
-                <div class="form-group">
-                    <label for="tenant_name">Tenant Name:</label>
-                    <input type="text" id="tenant_name" name="tenant_name" placeholder="e.g., ACME Corporation" required>
-                </div>
-                
-                <div class="form-group">
-                    <label for="template_type">Template Type:</label>
-                    <select id="template_type" name="template_type">
-                        <option value="simple">Simple Template (with user creation)</option>
-                        <option value="complex">Complex Template (all features)</option>
-                    </select>
-                </div>
-                
-                <button type="submit" class="btn" id="submitBtn">🚀 Create Tenant</button>
-            </form>
-            
-            <div id="result"></div>
-            
-            <div class="tenants-list">
-                <h2> Recent Tenants</h2>
-                <div id="tenants">Loading...</div>
-            </div>
-        </div>
-        
-        <script>
-            // Load existing tenants on page load
-            loadTenants();
-            
-            function loadTenants() {
-                fetch('/api/tenants')
-                    .then(response => response.json())
-                    .then(data => {
-                        const tenantsDiv = document.getElementById('tenants');
-                        if (data.tenants && data.tenants.length > 0) {
-                            tenantsDiv.innerHTML = data.tenants.map(t => 
-                                `<div class="tenant-item">
-                                    <strong>${t.tenant_id}</strong> 
-                                    ${t.tenant_name ? `- ${t.tenant_name}` : ''}
-                                    <small style="color: #666; margin-left: 10px;">(${t.created_at ? new Date(t.created_at).toLocaleDateString() : 'Unknown'})</small>
-                                    <a href="/api/tenants/${t.tenant_id}" target="_blank" style="margin-left: 10px;">View Config</a>
-                                </div>`
-                            ).join('');
-                        } else {
-                            tenantsDiv.innerHTML = '<p>No tenants created yet. Create your first tenant above!</p>';
-                        }
-                    })
-                    .catch(error => {
-                        document.getElementById('tenants').innerHTML = '<p>Error loading tenants.</p>';
-                    });
-            }
-            
-            // Handle form submission
-            document.getElementById('tenantForm').addEventListener('submit', function(e) {
-                e.preventDefault();
-                
-                const submitBtn = document.getElementById('submitBtn');
-                const resultDiv = document.getElementById('result');
-                
-                // Show loading state
-                submitBtn.disabled = true;
-                submitBtn.innerHTML = '<span class="spinner"></span> Creating...';
-                resultDiv.innerHTML = '<div class="result loading">Creating tenant configuration and triggering deployment...</div>';
-                
-                const formData = new FormData(e.target);
-                const data = {
-                    tenant_id: formData.get('tenant_id'),
-                    tenant_name: formData.get('tenant_name'),
-                    template_type: formData.get('template_type')
-                };
-                
-                fetch('/api/tenants/signup', {
-                    method: 'POST',
-                    headers: {
-                        'Content-Type': 'application/json',
-                    },
-                    body: JSON.stringify(data)
-                })
-                .then(response => response.json())
-                .then(result => {
-                    // Reset button
-                    submitBtn.disabled = false;
-                    submitBtn.innerHTML = 'Create Tenant';
-                    
-                    if (result.error) {
-                        resultDiv.innerHTML = `<div class="result error"><strong>Error:</strong> ${result.error}</div>`;
-                    } else {
-                        resultDiv.innerHTML = `
-                            <div class="result success">
-                                <h3>Tenant Created Successfully!</h3>
-                                <p><strong>Tenant ID:</strong> ${result.tenant_id}</p>
-                                <p><strong>Template:</strong> ${result.template_type} (${result.template_features})</p>
-                                <p><strong>Config File:</strong> ${result.config_file}</p>
-                                <p><strong>Git Status:</strong> ${result.git_committed ? 'Committed - Pipeline triggered!' : '⚠️ Local only'}</p>
-                                <p><em>The GitHub Actions pipeline is now deploying your configuration to Keycloak...</em></p>
-                                <p><strong>Realm URL:</strong> <a href="${result.keycloak_realm_url}" target="_blank">${result.keycloak_realm_url}</a></p>
-                                <div style="background: #fff3cd; border: 1px solid #ffeeba; color: #856404; padding: 15px; border-radius: 4px; margin-top: 15px;">
-                                    <h4>Security Notice</h4>
-                                    <p><strong>Admin credentials have been generated but are not displayed for security.</strong></p>
-                                    <p>To access your realm:</p>
-                                    <ol>
-                                        <li>Go to <a href="http://localhost:8080/admin" target="_blank">Keycloak Admin Console</a></li>
-                                        <li>Login with: admin / admin123</li>
-                                        <li>Select realm: <strong>${result.tenant_id}</strong></li>
-                                        <li>Create users manually via Users → Add User</li>
-                                    </ol>
-                                    <p><em>Manual user creation is the industry standard for security.</em></p>
-                                </div>
-                            </div>
-                        `;
-                        // Clear form and reload tenant list
-                        e.target.reset();
-                        setTimeout(loadTenants, 1000);
-                    }
-                })
-                .catch(error => {
-                    // Reset button
-                    submitBtn.disabled = false;
-                    submitBtn.innerHTML = 'Create Tenant';
-                    resultDiv.innerHTML = `<div class="result error"><strong>Network Error:</strong> ${error.message}</div>`;
-                });
-            });
-        </script>
-    </body>
-    </html>
-    """
-    
-    return render_template_string(html_template)
+    response = app.send_static_file('index.html')
+    response.cache_control.no_cache = None
+    response.cache_control.public = True
+    response.cache_control.max_age = 3600
+    return response
 
 @app.route('/api/tenants/signup', methods=['POST'])
 def signup_tenant():
@@ -395,30 +709,30 @@ def signup_tenant():
         # Parse request data
         data = request.get_json()
         if not data:
-            return jsonify({"error": "Request body must be JSON"}), 400
+            return ojsonify({"error": "Request body must be JSON"}, 400)
         
         tenant_id = data.get('tenant_id', '').strip().lower()
         tenant_name = data.get('tenant_name', '').strip()
         template_type = data.get('template_type', 'complex').strip().lower()  # 'complex' or 'simple'
         
         if not tenant_id or not tenant_name:
-            return jsonify({
+            return ojsonify({
                 "error": "Both tenant_id and tenant_name are required"
-            }), 400
+            }, 400)
         
         if template_type not in ['complex', 'simple']:
-            return jsonify({
+            return ojsonify({
                 "error": "template_type must be 'complex' or 'simple'"
-            }), 400
+            }, 400)
         
         is_valid, error_msg = validate_tenant_id(tenant_id)
         if not is_valid:
-            return jsonify({"error": error_msg}), 400
+            return ojsonify({"error": error_msg}, 400)
         
         if check_tenant_exists(tenant_id):
-            return jsonify({
+            return ojsonify({
                 "error": f"Tenant '{tenant_id}' already exists"
-            }), 409
+            }, 409)
         
         initial_password = generate_secure_password()
         
@@ -427,34 +741,43 @@ def signup_tenant():
         else:
             template_path = TENANT_TEMPLATE_PATH  # complex template
         
-        if not os.path.exists(template_path):
-            return jsonify({
+        template = TEMPLATES[template_type]
+        if template is None:
+            return ojsonify({
                 "error": f"Template not found at {template_path}"
-            }), 500
-        
-        with open(template_path, 'r') as f:
-            template_content = f.read()
+            }, 500)
         
-        template = Template(template_content)
         if template_type == 'simple':
-            config_content = template.render(
-                TENANT_ID=tenant_id,
-                TENANT_NAME=tenant_name,
-                ADMIN_PASSWORD=initial_password
-            )
+            template_vars = {
+                'TENANT_ID': tenant_id,
+                'TENANT_NAME': tenant_name,
+                'ADMIN_PASSWORD': initial_password
+            }
         else:
-            config_content = template.render(
-                tenant_id=tenant_id,
-                tenant_name=tenant_name,
-                initial_admin_password=initial_password
+            template_vars = {
+                'tenant_id': tenant_id,
+                'tenant_name': tenant_name,
+                'initial_admin_password': initial_password
+            }
+        
+        # Written atomically so the git worker and readers never pick up a half-written config, and
+        # exclusively so a concurrent signup for the same id can't overwrite it
+        tenant_config_path = f"{_TENANTS_PREFIX}{tenant_id}.yaml"
+        try:
+            st = _write_file_atomic(
+                tenant_config_path, template.render(**template_vars).encode('utf-8'), exclusive=True
             )
+        except FileExistsError:
+            return ojsonify({
+                "error": f"Tenant '{tenant_id}' already exists"
+            }, 409)
         
-        tenant_config_path = os.path.join(TENANTS_DIR, f"{tenant_id}.yaml")
-        with open(tenant_config_path, 'w') as f:
-            f.write(config_content)
+        with _index_lock:
+            _TENANTS[tenant_id] = {'path': tenant_config_path, 'mtime': st.st_mtime}
+            _bump_index_version()
         
-        # Perform Git operations
-        git_success, git_error = git_operations(tenant_id, "add")
+        # Queue Git operations for the background worker
+        git_queued, git_error = git_operations(tenant_id, "add")
         
         response_data = {
             "message": f"Tenant {tenant_id} signup completed successfully",
@@ -464,84 +787,126 @@ def signup_tenant():
             "template_features": "User creation + basic features" if template_type == 'simple' else "All advanced keycloak-config-cli features",
             "keycloak_realm_url": f"http://localhost:8080/realms/{tenant_id}",
             "config_file": f"tenants/{tenant_id}.yaml",
-            "git_committed": git_success,
+            # The commit happens in the background; git_status tracks it until then
+            "git_committed": False,
+            "git_status": "queued" if git_queued else "skipped",
             "security_notice": "Admin credentials generated but not returned for security. Create users manually via Keycloak Admin Console.",
-            "timestamp": datetime.utcnow().isoformat() + "Z"
+            "timestamp": _utc_iso()
         }
         
-        if not git_success:
+        if not git_queued:
             response_data["git_warning"] = f"Configuration saved but Git operation failed: {git_error}"
         
-        app.logger.info(f"Successfully created tenant: {tenant_id}")
-        return jsonify(response_data), 201
+        app.logger.info("Successfully created tenant: %s", tenant_id)
+        return ojsonify(response_data, 201)
     
     except Exception as e:
-        app.logger.error(f"Error creating tenant: {str(e)}")
-        return jsonify({
+        app.logger.error("Error creating tenant: %s", e)
+        return ojsonify({
             "error": "Internal server error occurred while creating tenant",
             "details": str(e) if app.debug else None
-        }), 500
+        }, 500)
+
+def _tenant_entry(tenant_id, meta):
+    """Build the listing row for a tenant once and keep it on its index entry"""
+    entry = meta.get('entry')
+    if entry is not None:
+        return entry
+    
+    if 'display_name' not in meta:
+        try:
+            meta['display_name'] = _extract_display_name(meta['path'])
+        except:
+            meta['display_name'] = None
+    
+    tenant_name = None
+    display_name = meta['display_name']
+    if display_name and ' Services' in display_name:
+        tenant_name = display_name.replace(' Services', '')
+    
+    entry = meta['entry'] = {
+        "tenant_id": tenant_id,
+        "tenant_name": tenant_name,
+        "config_file": f"tenants/{tenant_id}.yaml",
+        "created_at": _utc_iso(meta['mtime']),
+        "keycloak_realm_url": f"http://localhost:8080/realms/{tenant_id}"
+    }
+    return entry
 
 @app.route('/api/tenants', methods=['GET'])
 def list_tenants():
     """List all existing tenants"""
     try:
-        tenants = []
-        
-        if os.path.exists(TENANTS_DIR):
-            for filename in os.listdir(TENANTS_DIR):
-                if filename.endswith('.yaml'):
-                    tenant_id = filename[:-5]  # Remove .yaml extension
-                    tenant_path = os.path.join(TENANTS_DIR, filename)
-                    
-                    mtime = os.path.getmtime(tenant_path)
-                    created_at = datetime.fromtimestamp(mtime).isoformat() + "Z"
-                    
-                    tenant_name = None
-                    try:
-                        with open(tenant_path, 'r') as f:
-                            config = yaml.safe_load(f)
-                            display_name = config.get('displayName', '')
-                            if display_name and ' Services' in display_name:
-                                tenant_name = display_name.replace(' Services', '')
-                    except:
-                        pass
-                    
-                    tenants.append({
-                        "tenant_id": tenant_id,
-                        "tenant_name": tenant_name,
-                        "config_file": f"tenants/{filename}",
-                        "created_at": created_at,
-                        "keycloak_realm_url": f"http://localhost:8080/realms/{tenant_id}"
-                    })
-        
-        return jsonify({
-            "tenants": sorted(tenants, key=lambda x: x['created_at'], reverse=True),
-            "total_count": len(tenants)
-        })
+        global _tenant_list_cache
+        
+        refresh_index()
+        with _index_lock:
+            index = list(_TENANTS.items())
+            version = _index_version
+        etag = f"{_INDEX_ETAG_PREFIX}-{version}"
+        
+        # Browsers revalidate on every load (the UI refreshes right after a signup) but get a
+        # bodiless 304 while the index is unchanged
+        if request.if_none_match.contains(etag):
+            response = app.response_class(status=304)
+        else:
+            # Pollers without the ETag get the body encoded for this index version
+            cached_version, body = _tenant_list_cache
+            if cached_version != version:
+                index.sort(key=lambda item: item[1]['mtime'], reverse=True)
+                tenants = [_tenant_entry(tenant_id, meta) for tenant_id, meta in index]
+                body = orjson.dumps({
+                    "tenants": tenants,
+                    "total_count": len(tenants)
+                })
+                _tenant_list_cache = (version, body)
+            response = app.response_class(body, mimetype='application/json')
+        response.set_etag(etag)
+        response.cache_control.no_cache = True
+        return response
     
     except Exception as e:
-        app.logger.error(f"Error listing tenants: {str(e)}")
-        return jsonify({
+        app.logger.error("Error listing tenants: %s", e)
+        return ojsonify({
             "error": "Failed to list tenants",
             "details": str(e) if app.debug else None
-        }), 500
+        }, 500)
+
+def _tenant_info_response(body, etag):
+    """Tenant details response validated by etag; a None body means a 304 Not Modified"""
+    if body is None:
+        response = app.response_class(status=304)
+    else:
+        response = app.response_class(body, mimetype='application/json')
+    response.set_etag(etag)
+    response.cache_control.no_cache = True
+    return response
 
 @app.route('/api/tenants/<tenant_id>', methods=['GET'])
 def get_tenant(tenant_id):
     """Get information about a specific tenant"""
     try:
-        tenant_config_path = os.path.join(TENANTS_DIR, f"{tenant_id}.yaml")
-        
-        if not os.path.exists(tenant_config_path):
-            return jsonify({"error": f"Tenant '{tenant_id}' not found"}), 404
+        tenant_config_path = f"{_TENANTS_PREFIX}{tenant_id}.yaml"
         
-        mtime = os.path.getmtime(tenant_config_path)
-        created_at = datetime.fromtimestamp(mtime).isoformat() + "Z"
+        # Load and parse config; a missing file surfaces here instead of via a separate exists() probe
+        try:
+            st = os.stat(tenant_config_path)
+            
+            # The body only depends on the file version, so clients holding it revalidate with a stat
+            etag = f"{st.st_mtime_ns:x}-{st.st_size:x}"
+            if request.if_none_match.contains(etag):
+                return _tenant_info_response(None, etag)
+            
+            cached = _TENANT_INFO_CACHE.get(tenant_id)
+            if cached and cached[:2] == (st.st_mtime_ns, st.st_size):
+                return _tenant_info_response(cached[2], etag)
+            
+            with open(tenant_config_path, 'rb') as f:
+                config = yaml.load(f, Loader=_YamlLoader)
+        except FileNotFoundError:
+            return ojsonify({"error": f"Tenant '{tenant_id}' not found"}, 404)
         
-        # Load and parse config
-        with open(tenant_config_path, 'r') as f:
-            config = yaml.safe_load(f)
+        created_at = _utc_iso(st.st_mtime)
         
         # Extract key information
         tenant_info = {
@@ -558,68 +923,126 @@ def get_tenant(tenant_id):
             "users": [user.get('username') for user in config.get('users', [])]
         }
         
-        return jsonify(tenant_info)
+        body = orjson.dumps(tenant_info)
+        _TENANT_INFO_CACHE[tenant_id] = (st.st_mtime_ns, st.st_size, body)
+        return _tenant_info_response(body, etag)
     
     except Exception as e:
-        app.logger.error(f"Error getting tenant {tenant_id}: {str(e)}")
-        return jsonify({
+        app.logger.error("Error getting tenant %s: %s", tenant_id, e)
+        return ojsonify({
             "error": f"Failed to get tenant information",
             "details": str(e) if app.debug else None
-        }), 500
+        }, 500)
+
+@app.route('/api/tenants/<tenant_id>/git-status', methods=['GET'])
+def get_tenant_git_status(tenant_id):
+    """Get the state of the background git commit/push for a tenant"""
+    git_status = _git_status.get(("tenant", tenant_id))
+    if git_status is None:
+        return ojsonify({"error": f"No git operation recorded for tenant '{tenant_id}'"}, 404)
+    
+    return ojsonify({"tenant_id": tenant_id, **git_status})
+
+@app.route('/api/git/status', methods=['GET'])
+def get_git_queue_status():
+    """Report the background git worker's queue depth and per-state counts"""
+    counts = {"queued": 0, "in_progress": 0, "pushed": 0, "committed": 0, "failed": 0}
+    with _git_status_lock:
+        for git_status in _git_status.values():
+            counts[git_status["status"]] += 1
+    
+    return ojsonify({
+        "configured": bool(GITHUB_TOKEN and GITHUB_REPO),
+        "worker_running": _git_worker is not None and _git_worker.is_alive(),
+        "queue_depth": _git_queue.qsize(),
+        "batch_window": GIT_BATCH_WINDOW,
+        "batch_max": GIT_BATCH_MAX,
+        "operations": counts
+    })
 
 @app.route('/api/tenants/<tenant_id>', methods=['DELETE'])
 def delete_tenant(tenant_id):
     """Delete a tenant configuration (for cleanup/testing)"""
     try:
-        tenant_config_path = os.path.join(TENANTS_DIR, f"{tenant_id}.yaml")
-        
-        if not os.path.exists(tenant_config_path):
-            return jsonify({"error": f"Tenant '{tenant_id}' not found"}), 404
+        tenant_config_path = f"{_TENANTS_PREFIX}{tenant_id}.yaml"
         
         # Remove the file
-        os.remove(tenant_config_path)
-        
-        # Git operations for removal
         try:
-            subprocess.run([
-                "git", "-C", KEYCLOAK_CONFIGS_REPO_PATH,
-                "rm", f"tenants/{tenant_id}.yaml"
-            ], check=True, capture_output=True, text=True)
-            
-            subprocess.run([
-                "git", "-C", KEYCLOAK_CONFIGS_REPO_PATH,
-                "commit", "-m", f"feat: Remove tenant configuration for {tenant_id}"
-            ], check=True, capture_output=True, text=True)
-            
-            try:
-                subprocess.run([
-                    "git", "-C", KEYCLOAK_CONFIGS_REPO_PATH,
-                    "push"
-                ], check=True, capture_output=True, text=True)
-            except subprocess.CalledProcessError:
-                pass  
-            
-            git_success = True
-        except subprocess.CalledProcessError as e:
-            git_success = False
-            app.logger.warning(f"Git operations failed for tenant deletion: {e}")
+            os.remove(tenant_config_path)
+            removed = True
+        except FileNotFoundError:
+            removed = False
+        
+        # Only forget the tenant once its file is gone; any other remove error leaves it indexed
+        with _index_lock:
+            if _TENANTS.pop(tenant_id, None) is not None:
+                _bump_index_version()
+        _TENANT_INFO_CACHE.pop(tenant_id, None)
+        
+        if not removed:
+            return ojsonify({"error": f"Tenant '{tenant_id}' not found"}, 404)
+        
+        # Queue the removal for the background git worker, batched with any pending signups
+        git_queued, git_error = git_operations(tenant_id, "remove")
+        if not git_queued:
+            app.logger.warning("Git operations skipped for tenant deletion: %s", git_error)
         
-        return jsonify({
+        return ojsonify({
             "message": f"Tenant '{tenant_id}' configuration deleted successfully",
             "tenant_id": tenant_id,
-            "git_committed": git_success,
+            "git_committed": False,
+            "git_status": "queued" if git_queued else "skipped",
             "note": "This only removes the configuration file. The Keycloak realm may still exist."
         })
     
     except Exception as e:
-        app.logger.error(f"Error deleting tenant {tenant_id}: {str(e)}")
-        return jsonify({
+        app.logger.error("Error deleting tenant %s: %s", tenant_id, e)
+        return ojsonify({
             "error": f"Failed to delete tenant",
             "details": str(e) if app.debug else None
-        }), 500
+        }, 500)
 
 # Organizations Mode Endpoints
 
+# Scalar fields list_organizations reads; they sit above the (potentially long) domains: block
+_ORG_SUMMARY_KEYS = ('tenant_name', 'realm', 'keycloak_org_id', 'admin_email', 'tenant_domain')
+
+# org config path -> (st_mtime_ns, st_size, summary) so unchanged files are not re-parsed
+_ORG_CACHE = {}
+
+def _load_org_summary(path):
+    """Parse only the header of an *_org.yaml file, stopping at its top-level domains: block"""
+    with open(path, 'r') as f:
+        head = ''.join(itertools.takewhile(lambda line: not line.startswith('domains:'), f))
+    config = yaml.load(head, Loader=_YamlLoader) or {}
+    
+    if not all(key in config for key in _ORG_SUMMARY_KEYS):
+        # A field may have been placed after domains: - fall back to parsing the whole file
+        with open(path, 'r') as f:
+            config = yaml.load(f, Loader=_YamlLoader) or {}
+    return config
+
+def _org_domains(domains):
+    """Normalise signup domains to [{"name": ..., "verified": ...}], or return None if any entry is invalid"""
+    if not isinstance(domains, list):
+        return None
+    
+    normalised = []
+    for domain in domains:
+        if isinstance(domain, str):
+            domain = {'name': domain}
+        if not isinstance(domain, dict) or not isinstance(domain.get('name'), str) or not domain['name'].strip():
+            return None
+        if not isinstance(domain.get('verified', False), bool):
+            return None
+        normalised.append(domain)
+    return normalised
+
+def _yaml_quoted(value):
+    """Escape a string for the double-quoted YAML scalars in organization-template.yaml.j2"""
+    # JSON string escapes are valid in YAML double-quoted scalars
+    return orjson.dumps(value).decode('utf-8')[1:-1]
+
 @app.route('/api/organizations/signup', methods=['POST'])
 def signup_organization():
     """
@@ -627,107 +1050,136 @@ def signup_organization():
     from a template and saving it to the organizations directory.
     """
     if KTA_MODE != 'organizations':
-        return jsonify({
+        return ojsonify({
             "success": False,
             "error": "Backend not in organizations mode"
-        }), 400
+        }, 400)
 
     data = request.get_json()
     if not data:
-        return jsonify({"success": False, "error": "Invalid JSON"}), 400
+        return ojsonify({"success": False, "error": "Invalid JSON"}, 400)
 
     required_fields = ['org_name', 'org_alias', 'admin_email', 'admin_first_name', 'admin_last_name', 'domains']
     if not all(field in data for field in required_fields):
-        return jsonify({"success": False, "error": f"Missing one or more required fields: {required_fields}"}), 400
+        return ojsonify({"success": False, "error": f"Missing one or more required fields: {required_fields}"}, 400)
 
     org_alias = data['org_alias']
-    if not validate_tenant_id(org_alias):
-        return jsonify({
+    is_valid, _ = validate_tenant_id(org_alias)
+    if not is_valid:
+        return ojsonify({
             "success": False,
             "error": "Invalid organization alias. Use lowercase letters, numbers, and hyphens."
-        }), 400
+        }, 400)
+
+    domains = _org_domains(data['domains'])
+    if domains is None:
+        return ojsonify({
+            "success": False,
+            "error": "domains must be a list of domain names or objects with a non-empty name and a boolean verified"
+        }, 400)
 
-    org_config_path = Path(ORGS_DIR) / f"{org_alias}.yaml"
-    if org_config_path.exists():
-        return jsonify({"success": False, "error": "Organization already exists"}), 409
+    org_config_path = f"{_ORGS_PREFIX}{org_alias}.yaml"
+    # Cheap check before rendering; the index only rescans when the directory has changed
+    refresh_index()
+    with _index_lock:
+        org_exists = org_alias in _ORGS
+    if org_exists:
+        return ojsonify({"success": False, "error": "Organization already exists"}, 409)
 
     try:
-        with open(ORG_TEMPLATE_PATH) as f:
-            template = Template(f.read())
+        template = TEMPLATES['org']
+        if template is None:
+            raise FileNotFoundError(f"Template not found at {ORG_TEMPLATE_PATH}")
         
-        # Ensure domains is a list of objects
-        domains = data.get('domains', [])
-        if domains and isinstance(domains[0], str):
-            data['domains'] = [{'name': d} for d in domains]
-
-        rendered_config_str = template.render(data)
+        # User-supplied strings are escaped so quotes or newlines can't break the rendered YAML
+        context = {key: _yaml_quoted(value) if isinstance(value, str) else value for key, value in data.items()}
+        context['domains'] = [
+            {**domain, 'name': _yaml_quoted(domain['name'])} for domain in domains
+        ]
+        
+        # The template emits domains as a YAML list, so a single parse yields the final structure
+        rendered_config = yaml.load(template.render(context), Loader=_YamlLoader)
 
-        # The 'domains' field is rendered as a string, so we need to parse it back
-        # into the structure before saving the final YAML.
-        rendered_config = yaml.safe_load(rendered_config_str)
-        if 'domains' in rendered_config and isinstance(rendered_config['domains'], str):
-             rendered_config['domains'] = yaml.safe_load(rendered_config['domains'])
+        # Save the new organization file; the exclusive publish fails if the alias is already taken
+        _write_file_atomic(
+            org_config_path,
+            yaml.dump(rendered_config, Dumper=_YamlDumper, sort_keys=False, encoding='utf-8'),
+            exclusive=True
+        )
         
-        # Save the new organization file
-        with open(org_config_path, 'w') as f:
-            yaml.dump(rendered_config, f, sort_keys=False)
+        with _index_lock:
+            _ORGS.add(org_alias)
         
-        app.logger.info(f"Successfully created organization config file: {org_config_path}")
+        app.logger.info("Successfully created organization config file: %s", org_config_path)
 
         # Git operations to commit and push the new organization file
-        git_success, git_error = git_operations(org_alias, "add_org")
+        git_queued, git_error = git_operations(org_alias, "add_org")
 
         response_data = {
             "success": True,
             "message": f"Organization '{org_alias}' configuration created successfully.",
             "org_alias": org_alias,
-            "git_committed": git_success
+            "git_committed": False,
+            "git_status": "queued" if git_queued else "skipped"
         }
 
-        if not git_success:
+        if not git_queued:
             response_data["git_warning"] = f"Config file saved, but Git operation failed: {git_error}"
             # Still return a success because the file was created
-            return jsonify(response_data), 201
+            return ojsonify(response_data, 201)
             
+    except FileExistsError:
+        # Created by a concurrent signup after the existence check above
+        return ojsonify({"success": False, "error": "Organization already exists"}, 409)
     except Exception as e:
-        app.logger.error(f"Failed to render or save organization template: {e}")
-        return jsonify({"success": False, "error": "Failed to process organization template"}), 500
+        app.logger.error("Failed to render or save organization template: %s", e)
+        return ojsonify({"success": False, "error": "Failed to process organization template"}, 500)
             
-    return jsonify(response_data), 201
+    return ojsonify(response_data, 201)
+
+def _org_summary(path, name, tenant_id, stat):
+    """Return the listing summary for a legacy org config, re-parsing only when the file changed"""
+    cached = _ORG_CACHE.get(path)
+    if cached and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+        return cached[2]
+    
+    config = _load_org_summary(path)
+    summary = {
+        "tenant_id": tenant_id,
+        "tenant_name": config.get('tenant_name'),
+        "mode": "organizations",
+        "realm": config.get('realm', ORGANIZATIONS_REALM),
+        "organization_id": config.get('keycloak_org_id'),
+        "admin_email": config.get('admin_email'),
+        "domain": config.get('tenant_domain'),
+        "config_file": f"tenants/{name}",
+        "created_at": _utc_iso(stat.st_mtime)
+    }
+    _ORG_CACHE[path] = (stat.st_mtime_ns, stat.st_size, summary)
+    return summary
 
 @app.route('/api/organizations', methods=['GET'])
 def list_organizations():
     """List all organizations (from both local configs and Keycloak)"""
     try:
-        organizations = []
-        
-        # Get organizations from local config files
-        if os.path.exists(TENANTS_DIR):
-            for filename in os.listdir(TENANTS_DIR):
-                if filename.endswith('_org.yaml'):
-                    tenant_id = filename[:-9]  # Remove _org.yaml extension
-                    org_path = os.path.join(TENANTS_DIR, filename)
-                    
-                    try:
-                        with open(org_path, 'r') as f:
-                            config = yaml.safe_load(f)
-                        
-                        mtime = os.path.getmtime(org_path)
-                        created_at = datetime.fromtimestamp(mtime).isoformat() + "Z"
-                        
-                        organizations.append({
-                            "tenant_id": tenant_id,
-                            "tenant_name": config.get('tenant_name'),
-                            "mode": "organizations",
-                            "realm": config.get('realm', ORGANIZATIONS_REALM),
-                            "organization_id": config.get('keycloak_org_id'),
-                            "admin_email": config.get('admin_email'),
-                            "domain": config.get('tenant_domain'),
-                            "config_file": f"tenants/{filename}",
-                            "created_at": created_at
-                        })
-                    except Exception as e:
-                        app.logger.warning(f"Failed to load organization config {filename}: {e}")
+        # First pass only stats the indexed org configs so they can be ordered before any is
+        # parsed; a fresh stat also catches files edited in place since the last scan
+        refresh_index()
+        with _index_lock:
+            indexed = list(_org_files)
+        
+        org_files = []
+        for path, name, tenant_id in indexed:
+            try:
+                org_files.append((os.stat(path), path, name, tenant_id))
+            except FileNotFoundError:
+                continue
+        
+        # Drop cached summaries of configs that have been removed
+        live_paths = {path for _, path, _, _ in org_files}
+        for org_path in list(_ORG_CACHE):
+            if org_path not in live_paths:
+                _ORG_CACHE.pop(org_path, None)
         
         # Optionally get live data from Keycloak
         if KTA_MODE == 'organizations':
@@ -737,61 +1189,88 @@ def list_organizations():
                     # Here you could merge/compare with Keycloak data
                     pass
             except Exception as e:
-                app.logger.warning(f"Failed to fetch organizations from Keycloak: {e}")
+                app.logger.warning("Failed to fetch organizations from Keycloak: %s", e)
         
-        return jsonify({
-            "organizations": sorted(organizations, key=lambda x: x['created_at'], reverse=True),
-            "total_count": len(organizations),
-            "mode": KTA_MODE,
-            "realm": ORGANIZATIONS_REALM if KTA_MODE == 'organizations' else None
-        })
+        # Newest first, keyed on the numeric mtime rather than the formatted created_at string
+        org_files.sort(key=lambda org_file: org_file[0].st_mtime, reverse=True)
+        
+        def generate():
+            # Each organization is sent as soon as it is parsed; the count follows the list
+            total_count = 0
+            yield b'{"organizations":['
+            for stat, path, name, tenant_id in org_files:
+                try:
+                    summary = _org_summary(path, name, tenant_id, stat)
+                except Exception as e:
+                    app.logger.warning("Failed to load organization config %s: %s", name, e)
+                    continue
+                yield (b',' if total_count else b'') + orjson.dumps(summary)
+                total_count += 1
+            yield b'],' + orjson.dumps({
+                "total_count": total_count,
+                "mode": KTA_MODE,
+                "realm": ORGANIZATIONS_REALM if KTA_MODE == 'organizations' else None
+            })[1:]
+        
+        return app.response_class(stream_with_context(generate()), mimetype='application/json')
     
     except Exception as e:
-        app.logger.error(f"Error listing organizations: {str(e)}")
-        return jsonify({
+        app.logger.error("Error listing organizations: %s", e)
+        return ojsonify({
             "error": "Failed to list organizations",
             "details": str(e) if app.debug else None
-        }), 500
+        }, 500)
+
+# Templates are compiled at startup and the config paths don't change at runtime, so the
+# mode and health details are computed once rather than stat()ed on every request
+_TEMPLATE_STATUS = {
+    "realm_template_exists": TEMPLATES['complex'] is not None,
+    "simple_template_exists": TEMPLATES['simple'] is not None,
+    "org_template_exists": TEMPLATES['org'] is not None,
+    "org_realm_template_exists": os.path.exists(ORG_REALM_TEMPLATE_PATH)
+}
+
+_MODE_INFO = {
+    "mode": KTA_MODE,
+    "organizations_realm": ORGANIZATIONS_REALM if KTA_MODE == 'organizations' else None,
+    "keycloak_url": KEYCLOAK_URL,
+    "supports_realm_per_tenant": True,
+    "supports_organizations": True,
+    "current_config": _TEMPLATE_STATUS
+}
+
+_HEALTH_STATIC = {
+    "mode": KTA_MODE,
+    "template_exists": _TEMPLATE_STATUS["realm_template_exists"],
+    "simple_template_exists": _TEMPLATE_STATUS["simple_template_exists"],
+    "org_template_exists": _TEMPLATE_STATUS["org_template_exists"],
+    "tenants_dir_exists": os.path.exists(TENANTS_DIR),
+    "git_configured": bool(GITHUB_TOKEN and GITHUB_REPO),
+    "keycloak_url": KEYCLOAK_URL,
+    "yaml_libyaml": yaml.__with_libyaml__,
+    "environment": {
+        "PORT": PORT,
+        "KTA_MODE": KTA_MODE,
+        "ORGANIZATIONS_REALM": ORGANIZATIONS_REALM,
+        "GITHUB_REPO": GITHUB_REPO,
+        "GITHUB_TOKEN_SET": bool(GITHUB_TOKEN),
+        "REPO_PATH": KEYCLOAK_CONFIGS_REPO_PATH
+    }
+}
 
 @app.route('/api/mode', methods=['GET'])
 def get_mode():
     """Get current KTA mode and configuration"""
-    return jsonify({
-        "mode": KTA_MODE,
-        "organizations_realm": ORGANIZATIONS_REALM if KTA_MODE == 'organizations' else None,
-        "keycloak_url": KEYCLOAK_URL,
-        "supports_realm_per_tenant": True,
-        "supports_organizations": True,
-        "current_config": {
-            "realm_template_exists": os.path.exists(TENANT_TEMPLATE_PATH),
-            "simple_template_exists": os.path.exists(SIMPLE_TEMPLATE_PATH),
-            "org_template_exists": os.path.exists(ORG_TEMPLATE_PATH),
-            "org_realm_template_exists": os.path.exists(ORG_REALM_TEMPLATE_PATH)
-        }
-    })
+    return ojsonify(_MODE_INFO)
 
 @app.route('/health', methods=['GET'])
 def health_check():
     """Health check endpoint"""
-    return jsonify({
+    return ojsonify({
         "status": "healthy",
         "service": "kta-backend",
-        "timestamp": datetime.utcnow().isoformat() + "Z",
-        "mode": KTA_MODE,
-        "template_exists": os.path.exists(TENANT_TEMPLATE_PATH),
-        "simple_template_exists": os.path.exists(SIMPLE_TEMPLATE_PATH),
-        "org_template_exists": os.path.exists(ORG_TEMPLATE_PATH),
-        "tenants_dir_exists": os.path.exists(TENANTS_DIR),
-        "git_configured": bool(GITHUB_TOKEN and GITHUB_REPO),
-        "keycloak_url": KEYCLOAK_URL,
-        "environment": {
-            "PORT": PORT,
-            "KTA_MODE": KTA_MODE,
-            "ORGANIZATIONS_REALM": ORGANIZATIONS_REALM,
-            "GITHUB_REPO": GITHUB_REPO,
-            "GITHUB_TOKEN_SET": bool(GITHUB_TOKEN),
-            "REPO_PATH": KEYCLOAK_CONFIGS_REPO_PATH
-        }
+        "timestamp": _utc_iso(),
+        **_HEALTH_STATIC
     })
 
 if __name__ == '__main__':
@@ -799,20 +1278,22 @@ if __name__ == '__main__':
         try:
             subprocess.run([
                 "git", "-C", KEYCLOAK_CONFIGS_REPO_PATH, "init"
-            ], check=True, capture_output=True, text=True)
+            ], check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
             
             subprocess.run([
                 "git", "-C", KEYCLOAK_CONFIGS_REPO_PATH,
                 "config", "user.name", "kta Backend"
-            ], check=True, capture_output=True, text=True)
+            ], check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
             
             subprocess.run([
                 "git", "-C", KEYCLOAK_CONFIGS_REPO_PATH,
                 "config", "user.email", "kta@example.com"
-            ], check=True, capture_output=True, text=True)
+            ], check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
             
             print("Initialized Git repository for keycloak-configs")
         except subprocess.CalledProcessError as e:
+            print(f" Failed to initialize Git repository: {e.stderr.decode('utf-8', 'replace').strip()}")
+        except OSError as e:
             print(f" Failed to initialize Git repository: {e}")
     
     app.run(host='0.0.0.0', port=PORT, debug=False)